@@ -1,11 +1,28 @@
-import uuid
 import random
 import time
+from array import array
 import logging
+import logging.handlers
+import queue
+import threading
+import atexit
 import sys
+import gc
 import shlex
 import json
-from datetime import datetime
+import os
+import gzip
+import bisect
+import selectors
+import subprocess
+import itertools
+import orjson
+from secrets import token_urlsafe
+from pathlib import Path
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any, Callable
 
@@ -22,6 +39,7 @@ from kivy.uix.scrollview import ScrollView
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.textinput import TextInput
 import functools
+from operator import attrgetter
 from kivy.clock import Clock
 
 # -----------------------------
@@ -29,82 +47,343 @@ from kivy.clock import Clock
 # -----------------------------
 
 # Configure Logging
-logging.basicConfig(
-    filename='cradium_core.log',
-    filemode='a',
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    level=logging.DEBUG
+# Log records are pushed onto an in-process queue and written to disk by a
+# background listener thread, so hot paths (inventory/grid mutations) never
+# block on file I/O or record formatting.
+_log_queue = queue.Queue(-1)
+
+_log_file_handler = logging.FileHandler('cradium_core.log', mode='a', delay=True)
+_log_file_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 )
 
+# Buffer DEBUG/INFO records in memory and flush them to the file in bursts;
+# ERROR and above flush immediately. A daemon timer thread flushes every
+# second so buffered records never stall indefinitely.
+_log_memory_handler = logging.handlers.MemoryHandler(
+    capacity=512, flushLevel=logging.ERROR, target=_log_file_handler
+)
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.DEBUG)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_memory_handler, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+def _flush_log_buffer(interval: float = 1.0):
+    while True:
+        time.sleep(interval)
+        _log_memory_handler.flush()
+
+_log_flush_thread = threading.Thread(target=_flush_log_buffer, daemon=True)
+_log_flush_thread.start()
+
+_LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
 # -----------------------------
 # Utility Functions
 # -----------------------------
 
-def generate_uuid() -> str:
-    return str(uuid.uuid4())
+# IDs are only used as in-process dict keys, so a monotonic per-process
+# counter is enough — no CSPRNG read or UUID object per crafted material.
+# Legacy UUID strings in old saves are accepted unchanged by from_dict.
+_id_counter = itertools.count()
+_ID_PREFIX = f"{os.getpid():x}-"
+
+def generate_uuid(_next=_id_counter.__next__, _format=format) -> str:
+    return _ID_PREFIX + _format(_next(), 'x')
+
+_DEFAULT_SYLLABLES = ('Crad', 'Ium', 'Vex', 'Lun', 'Tori', 'Plas', 'Zynth', 'Nor', 'Del', 'Xar')
+
+# Rarity distribution with cumulative weights precomputed once; each roll
+# is a single uniform draw plus a C-level bisect into the table, with no
+# per-call allocation (random.choices rebuilds state and returns a list
+# even for k=1).
+_RARITY_LEVELS = ('Common', 'Uncommon', 'Rare', 'Epic', 'Legendary')
+_RARITY_CUM = (40, 70, 90, 98, 100)
+_RARITY_TOTAL = _RARITY_CUM[-1]
+
+def get_random_rarity(_bisect=bisect.bisect, _random=random.random) -> str:
+    return _RARITY_LEVELS[_bisect(_RARITY_CUM, _random() * _RARITY_TOTAL)]
 
 def generate_procedural_name(syllables: Optional[list] = None, min_syllables: int = 2, max_syllables: int = 3) -> str:
     if syllables is None:
-        syllables = ['Crad', 'Ium', 'Vex', 'Lun', 'Tori', 'Plas', 'Zynth', 'Nor', 'Del', 'Xar']
+        syllables = _DEFAULT_SYLLABLES
     name_length = random.randint(min_syllables, max_syllables)
-    name = ''.join(random.choice(syllables) for _ in range(name_length))
+    # One C-level choices() call instead of a generator of per-syllable
+    # random.choice calls.
+    name = ''.join(random.choices(syllables, k=name_length))
     return name.capitalize()
 
-def get_current_timestamp() -> str:
-    return datetime.utcnow().isoformat()
+def generate_random_string(length: int = 8) -> str:
+    # One C-level urandom read plus a base64 encode beats a Python loop of
+    # per-character random.choice calls.
+    return token_urlsafe(length)[:length]
 
-def validate_coordinates(x: int, y: int, layer: int, grid_width: int, grid_height: int, grid_layers: int) -> bool:
-    if 0 <= x < grid_width and 0 <= y < grid_height and 0 <= layer < grid_layers:
-        return True
-    else:
-        logging.warning(f"Invalid coordinates attempted: ({x}, {y}, {layer})")
-        return False
+def get_current_timestamp(_strftime=time.strftime, _gmtime=time.gmtime) -> str:
+    # Default-arg bindings turn the global+attribute lookups into LOAD_FAST,
+    # and strftime over gmtime skips datetime object construction entirely.
+    return _strftime('%Y-%m-%dT%H:%M:%S', _gmtime())
 
-def log_event(message: str, level: str = 'INFO'):
-    if level.upper() == 'DEBUG':
-        logging.debug(message)
-    elif level.upper() == 'INFO':
-        logging.info(message)
-    elif level.upper() == 'WARNING':
-        logging.warning(message)
-    elif level.upper() == 'ERROR':
-        logging.error(message)
-    elif level.upper() == 'CRITICAL':
-        logging.critical(message)
-    else:
-        logging.info(message)
-
-def save_game_state(player: 'Player', filename: str = 'savegame.json') -> bool:
+def validate_coordinates(x: int, y: int, layer: int, grid_width: int, grid_height: int, grid_layers: int) -> bool:
+    # Pure branchless bounds check; callers log failures where they have context.
+    return 0 <= x < grid_width and 0 <= y < grid_height and 0 <= layer < grid_layers
+
+# Active player name, injected into log records once per message instead of
+# every call site paying an attribute access and format slot for it.
+_log_player: ContextVar[str] = ContextVar('log_player', default='')
+
+def set_log_player(name: str):
+    # The prefix is concatenated into msg before %-formatting, so any % in
+    # the player name must be escaped or getMessage() raises on records
+    # that carry args.
+    _log_player.set(f"[{name.replace('%', '%%')}] " if name else '')
+
+def log_event(message: str, *args, level: str = 'INFO'):
+    # %-style args are formatted by the listener thread only if the record
+    # survives the level check, so hot paths never build strings for
+    # messages that end up dropped.
+    level_int = _LOG_LEVELS.get(level.upper(), logging.INFO)
+    if _root_logger.isEnabledFor(level_int):
+        prefix = _log_player.get()
+        _root_logger.log(level_int, prefix + message if prefix else message, *args)
+
+@contextmanager
+def quiet_logging(threshold: int = logging.WARNING):
+    # Bulk operations (grid clears, scripted auto-mining, save loads) emit a
+    # log record per touched item; raising the root level for the duration
+    # drops those records before any formatting or enqueueing happens.
+    previous = _root_logger.level
+    _root_logger.setLevel(threshold)
+    try:
+        yield
+    finally:
+        _root_logger.setLevel(previous)
+
+def save_game_data(data: Dict, filename: str = 'savegame.json', pretty: bool = False) -> bool:
+    # Serialization and the disk write, separated from the snapshot step so
+    # callers can take player.to_dict() on the UI thread and hand only this
+    # part to a worker.
     try:
-        with open(filename, 'w') as file:
-            json.dump(player.to_dict(), file, indent=4, default=str)
+        # orjson emits compact JSON bytes in one shot; the blob is heavily
+        # repetitive (ids, field names), so gzip at level 3 shrinks it by an
+        # order of magnitude for almost no CPU next to the write itself.
+        # Indented output is opt-in for debugging only. No default= fallback
+        # is installed: every to_dict emits JSON-native primitives, so a
+        # non-primitive value is a bug and should raise here rather than be
+        # silently str()-ed into the save.
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        gc.disable()
+        try:
+            with gzip.open(filename, 'wb', compresslevel=3) as file:
+                file.write(orjson.dumps(data, option=option))
+        finally:
+            gc.enable()
         logging.info("Game state saved successfully.")
         return True
     except Exception as e:
-        logging.error(f"Failed to save game state: {e}")
+        logging.error("Failed to save game state: %s", e)
         return False
 
+def save_game_state(player: 'Player', filename: str = 'savegame.json', pretty: bool = False) -> bool:
+    return save_game_data(player.to_dict(), filename, pretty)
+
 def load_game_state(filename: str = 'savegame.json') -> Optional['Player']:
     try:
-        with open(filename, 'r') as file:
-            data = json.load(file)
-        player = Player.from_dict(data)
+        raw = Path(filename).read_bytes()
+        if raw[:2] == b'\x1f\x8b':
+            raw = gzip.decompress(raw)
+        # Rebuilding a big save allocates many small objects in one burst;
+        # pausing the cyclic GC keeps collection passes from firing in the
+        # middle of it. Nothing built here is cyclic garbage, so deferring
+        # the scan is free.
+        gc.disable()
+        try:
+            data = orjson.loads(raw)
+            player = Player.from_dict(data)
+        finally:
+            gc.enable()
         logging.info("Game state loaded successfully.")
         return player
     except Exception as e:
-        logging.error(f"Failed to load game state: {e}")
+        logging.error("Failed to load game state: %s", e)
         return None
 
+# Description table built once at import; lookups during UI rendering are a
+# single dict hit with no per-call allocation.
+_MATERIAL_DESCRIPTIONS = {
+    'Metal': 'A sturdy metallic material, ideal for tools and machines.',
+    'Mineral': 'A raw mineral deposit, useful for processing and chemistry.',
+    'Plant': 'Organic plant matter, the basis of agriculture and breeding.',
+}
+
+def get_material_type_description(material_type: str) -> str:
+    return _MATERIAL_DESCRIPTIONS.get(material_type, 'Unknown material type.')
+
+def calculate_material_quality_bonus(quality: float) -> float:
+    return quality * 10
+
+# ANSI color table built once at import; each entry pre-concatenates the
+# escape prefix so displaying a colored line is a dict hit plus raw writes.
+_COLOR_WRAP = {
+    color: (code, '[0m')
+    for color, code in {
+        'black': '[30m',
+        'red': '[31m',
+        'green': '[32m',
+        'yellow': '[33m',
+        'blue': '[34m',
+        'magenta': '[35m',
+        'cyan': '[36m',
+        'white': '[37m',
+        'reset': '[0m',
+    }.items()
+}
+
+def display_colored_text(text: str, color: str = 'white'):
+    pre, post = _COLOR_WRAP.get(color, _COLOR_WRAP['white'])
+    write = sys.stdout.write
+    write(pre)
+    write(text)
+    write(post)
+    write('\n')
+
 def format_time(seconds: float) -> str:
     mins, secs = divmod(int(seconds), 60)
     hours, mins = divmod(mins, 60)
     return f"{hours}h {mins}m {secs}s"
 
+# -----------------------------
+# Script Execution
+# -----------------------------
+
+# Player automation scripts run in a single long-lived child interpreter
+# instead of fork+exec per script, amortizing interpreter startup
+# (~50-200ms per run) across the whole session. Frames on both pipes are
+# little-endian length-prefixed; the worker answers each script with a
+# JSON blob of its captured stdout/stderr.
+_WORKER_SOURCE = (
+    "import sys, io, json, contextlib\n"
+    "stdin, stdout = sys.stdin.buffer, sys.stdout.buffer\n"
+    "while True:\n"
+    "    header = stdin.read(4)\n"
+    "    if len(header) < 4:\n"
+    "        break\n"
+    "    source = stdin.read(int.from_bytes(header, 'little')).decode()\n"
+    "    out, err = io.StringIO(), io.StringIO()\n"
+    "    try:\n"
+    "        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):\n"
+    "            exec(compile(source, '<script>', 'exec'), {'__name__': '__main__'})\n"
+    "    except BaseException as exc:\n"
+    "        err.write(repr(exc))\n"
+    "    payload = json.dumps({'stdout': out.getvalue(), 'stderr': err.getvalue()}).encode()\n"
+    "    stdout.write(len(payload).to_bytes(4, 'little'))\n"
+    "    stdout.write(payload)\n"
+    "    stdout.flush()\n"
+)
+
+class ScriptWorker:
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self._process: Optional[subprocess.Popen] = None
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            # bufsize=0 keeps stdout a raw FileIO: _read_exact selects on
+            # the fd, and a buffered reader would slurp the payload frame
+            # into its Python-level buffer while reading the header, leaving
+            # the fd empty and the payload select() stuck until timeout.
+            self._process = subprocess.Popen(
+                [sys.executable, '-u', '-I', '-c', _WORKER_SOURCE],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+            log_event("Started persistent script worker.", level='DEBUG')
+        return self._process
+
+    def _read_exact(self, stream, count: int) -> Optional[bytes]:
+        selector = selectors.DefaultSelector()
+        selector.register(stream, selectors.EVENT_READ)
+        chunks = []
+        remaining = count
+        try:
+            while remaining > 0:
+                if not selector.select(self.timeout):
+                    return None
+                chunk = stream.read(remaining)
+                if not chunk:
+                    return None
+                chunks.append(chunk)
+                remaining -= len(chunk)
+        finally:
+            selector.close()
+        return b''.join(chunks)
+
+    def run(self, script_content: str) -> Dict[str, str]:
+        process = self._ensure_process()
+        encoded = script_content.encode()
+        process.stdin.write(len(encoded).to_bytes(4, 'little') + encoded)
+        process.stdin.flush()
+        header = self._read_exact(process.stdout, 4)
+        if header is None:
+            self.shutdown()
+            return {'stdout': '', 'stderr': 'Script timed out or worker died.'}
+        payload = self._read_exact(process.stdout, int.from_bytes(header, 'little'))
+        if payload is None:
+            self.shutdown()
+            return {'stdout': '', 'stderr': 'Script timed out or worker died.'}
+        return json.loads(payload)
+
+    def shutdown(self):
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+        self._process = None
+
+_script_worker = ScriptWorker()
+atexit.register(_script_worker.shutdown)
+
+def execute_script_once(script_content: str) -> Dict[str, str]:
+    # One-shot fallback: pipe the script to a fresh isolated interpreter on
+    # stdin. No tempfile is written, so the only cost is the fork+exec
+    # itself — no create/write/unlink filesystem round-trip per run.
+    try:
+        result = subprocess.run(
+            [sys.executable, '-I', '-'],
+            input=script_content,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        return {'stdout': result.stdout, 'stderr': result.stderr}
+    except subprocess.TimeoutExpired:
+        return {'stdout': '', 'stderr': 'Script timed out.'}
+
+def execute_script(script_content: str) -> Dict[str, str]:
+    try:
+        result = _script_worker.run(script_content)
+    except OSError:
+        _script_worker.shutdown()
+        result = execute_script_once(script_content)
+    log_event("Executed player script.", level='DEBUG')
+    return result
+
 # -----------------------------
 # Data Models
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Material:
     id: str
     name: str
@@ -113,133 +392,308 @@ class Material:
     material_type: str
     base_stone_type: str
 
+    def __post_init__(self):
+        # rarity/material_type/base_stone_type draw from small fixed sets;
+        # interning shares one string object across every Material and makes
+        # equality checks pointer comparisons. id is interned because it is
+        # the hot dict key in inventories and grids.
+        object.__setattr__(self, 'id', sys.intern(self.id))
+        object.__setattr__(self, 'rarity', sys.intern(self.rarity))
+        object.__setattr__(self, 'material_type', sys.intern(self.material_type))
+        object.__setattr__(self, 'base_stone_type', sys.intern(self.base_stone_type))
+
     def to_dict(self) -> Dict:
-        return self.__dict__
+        return {
+            'id': self.id,
+            'name': self.name,
+            'rarity': self.rarity,
+            'quality': self.quality,
+            'material_type': self.material_type,
+            'base_stone_type': self.base_stone_type,
+        }
+
+# Field tuple and attrgetter hoisted once so bulk Material serialization is
+# one C-level attribute fetch + zip per item instead of six dict inserts
+# through Python-level method calls.
+_MAT_FIELDS = ('id', 'name', 'rarity', 'quality', 'material_type', 'base_stone_type')
+_mat_values = attrgetter(*_MAT_FIELDS)
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     material: Material
     quantity: int = 1
 
-@dataclass
+# Zero-quantity sentinel for missing-ingredient checks.
+_EMPTY_STACK = InventoryItem(material=None, quantity=0)
+
+@dataclass(slots=True)
 class Inventory:
     items: Dict[str, InventoryItem] = field(default_factory=dict)
+    # Secondary index: lowercased material name -> item. Maintained on every
+    # mutation so name lookups are O(1) instead of a linear scan; rebuilt on
+    # load and never serialized.
+    _by_name: Dict[str, InventoryItem] = field(default_factory=dict, repr=False)
 
     def add_item(self, material: Material, quantity: int = 1):
-        if material.id in self.items:
-            self.items[material.id].quantity += quantity
+        # Single probe: get() covers the common already-stacked path with
+        # one hash instead of a membership test plus an indexed lookup.
+        item = self.items.get(material.id)
+        if item is not None:
+            item.quantity += quantity
         else:
-            self.items[material.id] = InventoryItem(material, quantity)
-        log_event(f"Added {quantity} x {material.name} to inventory.", 'DEBUG')
+            item = InventoryItem(material, quantity)
+            self.items[material.id] = item
+            self._by_name.setdefault(material.name.lower(), item)
+        log_event("Added %s x %s to inventory.", quantity, material.name, level='DEBUG')
 
     def remove_item(self, material_id: str, quantity: int = 1) -> bool:
-        if material_id in self.items and self.items[material_id].quantity >= quantity:
-            self.items[material_id].quantity -= quantity
-            if self.items[material_id].quantity == 0:
+        item = self.items.get(material_id)
+        if item is not None and item.quantity >= quantity:
+            item.quantity -= quantity
+            if item.quantity == 0:
                 del self.items[material_id]
-            log_event(f"Removed {quantity} x {material_id} from inventory.", 'DEBUG')
+                name_key = item.material.name.lower()
+                if self._by_name.get(name_key) is item:
+                    del self._by_name[name_key]
+            log_event("Removed %s x %s from inventory.", quantity, material_id, level='DEBUG')
             return True
-        log_event(f"Failed to remove {quantity} x {material_id} from inventory.", 'WARNING')
+        log_event("Failed to remove %s x %s from inventory.", quantity, material_id, level='WARNING')
         return False
 
+    def add_items(self, pairs) -> int:
+        # Bulk insert: one aggregate log line instead of one per stack, and
+        # locals hoisted so the loop body is just dict probes.
+        items = self.items
+        by_name = self._by_name
+        count = 0
+        for material, quantity in pairs:
+            item = items.get(material.id)
+            if item is not None:
+                item.quantity += quantity
+            else:
+                item = InventoryItem(material, quantity)
+                items[material.id] = item
+                by_name.setdefault(material.name.lower(), item)
+            count += 1
+        log_event("Bulk-added %s stacks to inventory.", count, level='DEBUG')
+        return count
+
+    def remove_items(self, pairs) -> int:
+        # Bulk removal counterpart to add_items; skips stacks it cannot
+        # fully satisfy and reports one aggregate log line.
+        removed = 0
+        for material_id, quantity in pairs:
+            item = self.items.get(material_id)
+            if item is None or item.quantity < quantity:
+                continue
+            item.quantity -= quantity
+            if item.quantity == 0:
+                del self.items[material_id]
+                name_key = item.material.name.lower()
+                if self._by_name.get(name_key) is item:
+                    del self._by_name[name_key]
+            removed += 1
+        log_event("Bulk-removed %s stacks from inventory.", removed, level='DEBUG')
+        return removed
+
+    def get_item_by_id(self, material_id: str) -> Optional['InventoryItem']:
+        return self.items.get(material_id)
+
     def get_item_by_name(self, name: str) -> Optional['InventoryItem']:
-        for item in self.items.values():
-            if item.material.name.lower() == name.lower():
-                return item
-        return None
+        # Skip the .lower() allocation when the query is already lowercase.
+        return self._by_name.get(name if name.islower() else name.lower())
 
     def list_inventory(self) -> List['InventoryItem']:
         return list(self.items.values())
 
     def to_dict(self) -> Dict:
-        return {
-            material_id: {
-                'material': item.material.to_dict(),
-                'quantity': item.quantity
-            }
-            for material_id, item in self.items.items()
-        }
+        # Quantities only; full Material records are emitted once in the
+        # save's top-level 'materials' section instead of per inventory entry.
+        return {material_id: item.quantity for material_id, item in self.items.items()}
 
     @staticmethod
     def from_dict(data: Dict) -> 'Inventory':
         inventory = Inventory()
         for material_id, item_data in data.items():
-            material_data = item_data['material']
-            # Use MATERIALS_LOOKUP to get the material
-            if material_id in MATERIALS_LOOKUP:
-                material = MATERIALS_LOOKUP[material_id]
+            if isinstance(item_data, dict):
+                # Legacy saves embedded the full material per entry; intern
+                # through MATERIALS_LOOKUP so duplicate records across save
+                # sections collapse to one shared Material instance.
+                quantity = item_data['quantity']
+                material = MATERIALS_LOOKUP.get(material_id)
+                if material is None:
+                    material = MATERIALS_LOOKUP[material_id] = Material(**item_data['material'])
             else:
-                # Material not found in lookup, reconstruct from data
-                material = Material(**material_data)
-                MATERIALS_LOOKUP[material_id] = material
-            inventory.items[material_id] = InventoryItem(material, item_data['quantity'])
+                quantity = item_data
+                material = MATERIALS_LOOKUP.get(material_id)
+                if material is None:
+                    log_event("Inventory entry %s has no material record; skipped.", material_id, level='WARNING')
+                    continue
+            item = InventoryItem(material, quantity)
+            inventory.items[material_id] = item
+            inventory._by_name.setdefault(material.name.lower(), item)
         return inventory
 
-@dataclass
+@dataclass(slots=True)
 class CraftingGrid:
+    # Cells are stored structure-of-arrays style: one flat, contiguous int32
+    # array of indices into a per-grid material table (-1 = empty) instead of
+    # a layers x height x width list of Material references. Cell access is a
+    # single index computation and serialization is one linear pass.
     width: int = 5
     height: int = 5
     layers: int = 1
-    grid: List[List[List[Optional[Material]]]] = field(init=False)
+    # Cell storage is allocated on first write; a grid that has never had an
+    # item placed costs O(1) memory regardless of its dimensions, which
+    # matters when many large, mostly-empty grids are constructed or loaded.
+    _cells: Optional[array] = field(init=False, repr=False)
+    _materials: List[Material] = field(init=False, repr=False)
+    _index_of: Dict[str, int] = field(init=False, repr=False)
 
     def __post_init__(self):
-        self.grid = [[[None for _ in range(self.width)] for _ in range(self.height)] for _ in range(self.layers)]
-        log_event(f"Initialized Crafting Grid with {self.layers} layers of {self.width}x{self.height}.", 'DEBUG')
+        self._cells = None
+        self._materials = []
+        self._index_of = {}
+        log_event(f"Initialized Crafting Grid with {self.layers} layers of {self.width}x{self.height}.", level='DEBUG')
+
+    def _ensure_cells(self) -> array:
+        if self._cells is None:
+            self._cells = array('i', [-1]) * (self.width * self.height * self.layers)
+        return self._cells
+
+    def _intern(self, material: Material) -> int:
+        idx = self._index_of.get(material.id)
+        if idx is None:
+            idx = len(self._materials)
+            self._materials.append(material)
+            self._index_of[material.id] = idx
+        return idx
+
+    def _cell_index(self, x: int, y: int, layer: int) -> int:
+        return (layer * self.height + y) * self.width + x
+
+    def get_item(self, x: int, y: int, layer: int) -> Optional[Material]:
+        cells = self._cells
+        if cells is None:
+            return None
+        width, height = self.width, self.height
+        if not (0 <= x < width and 0 <= y < height and 0 <= layer < self.layers):
+            return None
+        idx = cells[(layer * height + y) * width + x]
+        return self._materials[idx] if idx >= 0 else None
 
     def place_item(self, x: int, y: int, layer: int, material: Material) -> bool:
-        if self.is_valid_position(x, y, layer):
-            if self.grid[layer][y][x] is None:
-                self.grid[layer][y][x] = material
-                log_event(f"Placed {material.name} at ({x}, {y}) on layer {layer}.", 'INFO')
+        if 0 <= x < self.width and 0 <= y < self.height and 0 <= layer < self.layers:
+            cells = self._ensure_cells()
+            cell = (layer * self.height + y) * self.width + x
+            if cells[cell] < 0:
+                cells[cell] = self._intern(material)
+                log_event("Placed %s at (%s, %s) on layer %s.", material.name, x, y, layer, level='INFO')
                 return True
             else:
-                log_event(f"Attempted to place {material.name} at occupied position ({x}, {y}, {layer}).", 'WARNING')
+                log_event(f"Attempted to place {material.name} at occupied position ({x}, {y}, {layer}).", level='WARNING')
         else:
-            log_event(f"Attempted to place item at invalid position ({x}, {y}, {layer}).", 'WARNING')
+            log_event(f"Attempted to place item at invalid position ({x}, {y}, {layer}).", level='WARNING')
         return False
 
     def remove_item(self, x: int, y: int, layer: int) -> (bool, Optional[Material]):
-        if self.is_valid_position(x, y, layer):
-            material = self.grid[layer][y][x]
-            if material:
-                self.grid[layer][y][x] = None
-                log_event(f"Removed {material.name} from ({x}, {y}) on layer {layer}.", 'INFO')
+        if 0 <= x < self.width and 0 <= y < self.height and 0 <= layer < self.layers:
+            cells = self._cells
+            if cells is None:
+                log_event(f"Attempted to remove item from empty position ({x}, {y}, {layer}).", level='WARNING')
+                return False, None
+            cell = (layer * self.height + y) * self.width + x
+            idx = cells[cell]
+            if idx >= 0:
+                cells[cell] = -1
+                material = self._materials[idx]
+                log_event("Removed %s from (%s, %s) on layer %s.", material.name, x, y, layer, level='INFO')
                 return True, material
             else:
-                log_event(f"Attempted to remove item from empty position ({x}, {y}, {layer}).", 'WARNING')
+                log_event(f"Attempted to remove item from empty position ({x}, {y}, {layer}).", level='WARNING')
                 return False, None
         else:
-            log_event(f"Attempted to remove item from invalid position ({x}, {y}, {layer}).", 'WARNING')
+            log_event(f"Attempted to remove item from invalid position ({x}, {y}, {layer}).", level='WARNING')
             return False, None
 
+    def clear(self):
+        if self._cells is not None:
+            self._cells = array('i', [-1]) * len(self._cells)
+
+    def drain_all(self) -> Counter:
+        # Empty the whole grid in one pass and report what came out as
+        # material -> count, so callers can merge it into an inventory with
+        # one bulk call instead of per-cell remove/add round trips.
+        cells = self._cells
+        if cells is None:
+            return Counter()
+        counts = Counter(cells)
+        counts.pop(-1, None)
+        self._cells = array('i', [-1]) * len(cells)
+        materials = self._materials
+        return Counter({materials[idx]: qty for idx, qty in counts.items()})
+
+    def material_counts(self) -> Counter:
+        # One C-level Counter pass over the raw index array, then a remap of
+        # the handful of distinct indices to material ids — no Python-level
+        # triple loop over layers/rows/columns.
+        cells = self._cells
+        if cells is None:
+            return Counter()
+        counts = Counter(cells)
+        counts.pop(-1, None)
+        materials = self._materials
+        return Counter({materials[idx].id: qty for idx, qty in counts.items()})
+
     def is_valid_position(self, x: int, y: int, layer: int) -> bool:
         return validate_coordinates(x, y, layer, self.width, self.height, self.layers)
 
     def to_dict(self) -> Dict:
+        # Compact payload: a material-id table plus flat index cells, so each
+        # occupied cell costs one small int in the save instead of a repeated
+        # 36-char id string. Emitting the index array is a straight copy of
+        # the internal storage — no per-cell resolution at all.
         return {
             'width': self.width,
             'height': self.height,
             'layers': self.layers,
-            'grid': [
-                [
-                    [material.id if material else None for material in row]
-                    for row in layer
-                ]
-                for layer in self.grid
-            ]
+            'table': [material.id for material in self._materials],
+            'cells': self._cells.tolist() if self._cells is not None else [],
         }
 
     @staticmethod
     def from_dict(data: Dict, materials_lookup: Dict[str, Material]) -> 'CraftingGrid':
         grid = CraftingGrid(width=data['width'], height=data['height'], layers=data['layers'])
-        for layer_idx, layer in enumerate(data['grid']):
-            for y_idx, row in enumerate(layer):
-                for x_idx, material_id in enumerate(row):
-                    if material_id and material_id in materials_lookup:
-                        grid.grid[layer_idx][y_idx][x_idx] = materials_lookup[material_id]
+        if 'cells' in data:
+            if not data['cells']:
+                return grid
+            remap = {}
+            for table_idx, material_id in enumerate(data['table']):
+                material = materials_lookup.get(material_id)
+                if material is not None:
+                    remap[table_idx] = grid._intern(material)
+            if len(remap) == len(data['table']):
+                # Every table entry resolved, so the remap is the identity
+                # and the cell array can be adopted wholesale in one C-level
+                # copy instead of a per-cell Python loop.
+                grid._cells = array('i', data['cells'])
+            else:
+                cells = grid._ensure_cells()
+                for cell, idx in enumerate(data['cells']):
+                    if idx >= 0:
+                        cells[cell] = remap.get(idx, -1)
+        else:
+            # Legacy saves: nested layers x height x width lists of ids.
+            cells = grid._ensure_cells()
+            for layer_idx, layer in enumerate(data['grid']):
+                for y_idx, row in enumerate(layer):
+                    for x_idx, material_id in enumerate(row):
+                        if material_id and material_id in materials_lookup:
+                            cell = grid._cell_index(x_idx, y_idx, layer_idx)
+                            cells[cell] = grid._intern(materials_lookup[material_id])
         return grid
 
-@dataclass
+@dataclass(slots=True)
 class Machine:
     id: str
     name: str
@@ -250,12 +704,33 @@ class Machine:
     last_used_time: float = field(default_factory=time.time)
     power: float = 0.0  # Power level of the machine
     active: bool = False  # Whether the machine is currently active
+    # Human-readable cooldown cached at construction; cooldown_time never
+    # changes after creation, so listings reuse one string instead of
+    # re-running format_time per render.
+    _cooldown_str: str = field(init=False, repr=False)
+    # Absolute timestamp at which the cooldown expires; the tick loop
+    # compares against one sampled clock value instead of calling
+    # time.time() per machine.
+    next_ready: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._cooldown_str = format_time(self.cooldown_time)
+        self.next_ready = self.last_used_time + self.cooldown_time
 
     def to_dict(self) -> Dict:
-        data = self.__dict__.copy()
-        if self.crafting_grid:
-            data['crafting_grid'] = self.crafting_grid.to_dict()
-        return data
+        # Explicit field list: slotted instances have no __dict__, and the
+        # derived _cooldown_str/next_ready caches stay out of the save.
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'properties': self.properties,
+            'crafting_grid': self.crafting_grid.to_dict() if self.crafting_grid else None,
+            'cooldown_time': self.cooldown_time,
+            'last_used_time': self.last_used_time,
+            'power': self.power,
+            'active': self.active,
+        }
 
     @staticmethod
     def from_dict(data: Dict) -> 'Machine':
@@ -274,28 +749,129 @@ class Machine:
             active=data.get('active', False)
         )
 
-    def can_use(self) -> bool:
-        return time.time() - self.last_used_time >= self.cooldown_time
+    def can_use(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) >= self.next_ready
 
-    def use(self):
-        if self.can_use():
-            self.last_used_time = time.time()
+    def use(self, now: Optional[float] = None):
+        if now is None:
+            now = time.time()
+        if now >= self.next_ready:
+            self.last_used_time = now
+            self.next_ready = now + self.cooldown_time
             # Implement machine's functionality here
             return True
         else:
             return False
 
-@dataclass
+@dataclass(slots=True)
 class CraftingRecipe:
     id: str
     name: str
     ingredients: Dict[str, int]  # material_id to quantity
     output: Material
     output_quantity: int
+    # Formatted ingredient listing, built on first use and kept; the recipe
+    # table is static after load so it never needs invalidating.
+    _ingredients_text: Optional[str] = field(default=None, init=False, repr=False)
+    # Ingredients frozen to a flat (material_id, qty) tuple at registration;
+    # craft loops iterate this instead of building a dict view per attempt.
+    _ingredient_items: tuple = field(default=(), init=False, repr=False)
+
+    def ingredients_text(self) -> str:
+        text = self._ingredients_text
+        if text is None:
+            text = self._ingredients_text = "\n".join(
+                f"{get_material_name(material_id)} x{quantity}"
+                for material_id, quantity in self.ingredients.items())
+        return text
+
+@dataclass(slots=True)
+class Script:
+    id: str
+    name: str
+    content: str
+    # Lowercased name computed once; lookups and index maintenance compare
+    # against it instead of re-lowercasing the stored name per operation.
+    _lname: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._lname = self.name.lower()
+
+    def to_dict(self) -> Dict:
+        return {'id': self.id, 'name': self.name, 'content': self.content}
+
+    @staticmethod
+    def from_dict(data: Dict) -> 'Script':
+        return Script(id=data['id'], name=data['name'], content=data['content'])
 
 # Global variables for materials and recipes
 MATERIALS_LOOKUP = {}
 RECIPES = {}
+# Lowercased-name index over RECIPES so name resolution in console
+# commands is O(1) instead of a scan over every recipe.
+RECIPES_BY_LNAME = {}
+# Canonical ingredient-signature index: tuple(sorted((material_id, qty)))
+# -> recipe, so matching a grid against the recipe book is one dict hit
+# instead of a scan over every recipe per craft attempt.
+RECIPES_BY_SIG = {}
+
+def recipe_signature(ingredients: Dict[str, int]) -> tuple:
+    return tuple(sorted(ingredients.items()))
+
+def register_recipe(recipe: 'CraftingRecipe'):
+    RECIPES[recipe.id] = recipe
+    RECIPES_BY_LNAME[recipe.name.lower()] = recipe
+    RECIPES_BY_SIG[recipe_signature(recipe.ingredients)] = recipe
+    recipe._ingredient_items = tuple(recipe.ingredients.items())
+
+def get_recipe_by_id(recipe_id: str) -> Optional['CraftingRecipe']:
+    return RECIPES.get(recipe_id)
+
+def find_recipe_by_name(name: str) -> Optional['CraftingRecipe']:
+    return RECIPES_BY_LNAME.get(name.lower())
+
+def find_recipe_for_grid(grid: 'CraftingGrid') -> Optional['CraftingRecipe']:
+    # Aggregate the grid contents in one pass, freeze to the canonical
+    # signature and resolve with a single lookup in RECIPES_BY_SIG.
+    counts = grid.material_counts()
+    if not counts:
+        return None
+    return RECIPES_BY_SIG.get(tuple(sorted(counts.items())))
+
+def get_material_name(material_id: str) -> str:
+    # MATERIALS_LOOKUP is the flat id->Material index, so name resolution is
+    # a single dict hit — never a walk over inventories or grid cells.
+    material = MATERIALS_LOOKUP.get(material_id)
+    return material.name if material is not None else "Unknown"
+
+class MaterialRegistry:
+    # Flyweight pool: identical-template materials share one interned
+    # Material instance instead of a fresh object per producer tick or
+    # save slot. Shared instances also mean machine output stacks in the
+    # inventory, since stacking is keyed on material id.
+    _pool: Dict[tuple, Material] = {}
+
+    @classmethod
+    def intern(cls, name: str, rarity: str, quality: float,
+               material_type: str, base_stone_type: str,
+               material_id: Optional[str] = None) -> Material:
+        # Callers may supply a deterministic id (e.g. 'gen:<resource>') so
+        # the same template resolves to the same id across sessions and
+        # saved games; otherwise a fresh uuid is minted on first intern.
+        key = (name, rarity, quality, material_type, base_stone_type)
+        material = cls._pool.get(key)
+        if material is None:
+            material = Material(
+                id=material_id if material_id is not None else generate_uuid(),
+                name=name,
+                rarity=rarity,
+                quality=quality,
+                material_type=material_type,
+                base_stone_type=base_stone_type
+            )
+            cls._pool[key] = material
+            MATERIALS_LOOKUP[material.id] = material
+        return material
 
 def load_sample_recipes():
     global MATERIALS_LOOKUP
@@ -346,9 +922,9 @@ def load_sample_recipes():
         output_quantity=1
     )
 
-    RECIPES['recipe_pickaxe'] = recipe_pickaxe
+    register_recipe(recipe_pickaxe)
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     inventory: Inventory = field(default_factory=Inventory)
@@ -357,28 +933,73 @@ class Player:
     machines: List[Machine] = field(default_factory=list)
     developer_mode: bool = False
     power: float = 0.0  # Player's available power
+    scripts: List[Script] = field(default_factory=list)
+    # Lowercased-name index over scripts: command lookups are one dict hit
+    # instead of an O(n) scan re-lowercasing every stored name. Rebuilt on
+    # load, never serialized.
+    _scripts_by_lname: Dict[str, Script] = field(default_factory=dict, repr=False)
+
+    def add_script(self, script: Script) -> bool:
+        key = script._lname
+        if key in self._scripts_by_lname:
+            return False
+        self.scripts.append(script)
+        self._scripts_by_lname[key] = script
+        log_event(f"Added script '{script.name}'.", level='INFO')
+        return True
+
+    def get_script(self, name: str) -> Optional[Script]:
+        return self._scripts_by_lname.get(name.lower())
+
+    def remove_script(self, name: str) -> bool:
+        script = self._scripts_by_lname.pop(name.lower(), None)
+        if script is None:
+            return False
+        # Identity scan with break instead of list.remove, which would run
+        # the dataclass field-by-field __eq__ against every element.
+        for i, candidate in enumerate(self.scripts):
+            if candidate is script:
+                del self.scripts[i]
+                break
+        log_event(f"Removed script '{script.name}'.", level='INFO')
+        return True
 
     def initialize_base(self):
         self.base_initialized = True
-        log_event(f"Base initialized for player {self.name}.", 'INFO')
+        log_event("Base initialized.", level='INFO')
 
     def to_dict(self) -> Dict:
         return {
             'name': self.name,
+            # Single source of truth for material records: dumped once here,
+            # referenced by id everywhere else in the save.
+            'materials': {
+                material_id: dict(zip(_MAT_FIELDS, _mat_values(material)))
+                for material_id, material in MATERIALS_LOOKUP.items()
+            },
             'inventory': self.inventory.to_dict(),
             'crafting_grid': self.crafting_grid.to_dict(),
             'base_initialized': self.base_initialized,
             'machines': [machine.to_dict() for machine in self.machines],
             'developer_mode': self.developer_mode,
             'power': self.power,
+            'scripts': [script.to_dict() for script in self.scripts],
         }
 
     @staticmethod
     def from_dict(data: Dict) -> 'Player':
+        # Restore the material table first so inventories and grids can
+        # resolve ids without embedded records. Existing entries win, so a
+        # re-load in the same session reuses interned instances instead of
+        # constructing a throwaway Material per table row.
+        for material_id, material_data in data.get('materials', {}).items():
+            if material_id not in MATERIALS_LOOKUP:
+                MATERIALS_LOOKUP[material_id] = Material(**material_data)
         inventory = Inventory.from_dict(data['inventory'])
         materials_lookup = MATERIALS_LOOKUP
         crafting_grid = CraftingGrid.from_dict(data['crafting_grid'], materials_lookup)
         machines = [Machine.from_dict(m) for m in data.get('machines', [])]
+        scripts = [Script.from_dict(s) for s in data.get('scripts', [])]
         player = Player(
             name=data['name'],
             inventory=inventory,
@@ -387,49 +1008,58 @@ class Player:
             machines=machines,
             developer_mode=data.get('developer_mode', False),
             power=data.get('power', 0.0),
+            scripts=scripts,
         )
+        player._scripts_by_lname = {s._lname: s for s in scripts}
         return player
 
     def update_machines(self):
+        # Sample the clock once per tick; each machine compares its cached
+        # next_ready timestamp against that instead of calling time.time().
+        now = time.time()
         for machine in self.machines:
-            if machine.active and machine.can_use():
+            if machine.active and machine.next_ready <= now:
                 self.power += machine.power  # Update power based on machine output
-                machine.use()
+                machine.use(now)
                 # For resource generation
-                if 'resource_output' in machine.properties:
-                    material = Material(
-                        id=generate_uuid(),
-                        name=machine.properties['resource_output'],
+                resource = machine.properties.get('resource_output')
+                if resource is not None:
+                    material = MaterialRegistry.intern(
+                        name=resource,
                         rarity='Common',
                         quality=1.0,
                         material_type='Generated',
-                        base_stone_type=''
+                        base_stone_type='',
+                        material_id='gen:' + resource,
                     )
                     self.inventory.add_item(material)
-                    log_event(f"Machine {machine.name} produced {material.name}.", 'INFO')
+                    log_event("Machine %s produced %s.", machine.name, material.name, level='INFO')
 
     def craft_item(self, recipe_id) -> bool:
-        if recipe_id in RECIPES:
-            recipe = RECIPES[recipe_id]
-            # Check if the player has the required ingredients
+        recipe = RECIPES.get(recipe_id)
+        if recipe is not None:
+            # Check if the player has the required ingredients: one hash per
+            # ingredient via get with a zero-quantity sentinel, instead of an
+            # 'in' probe followed by a second indexed lookup.
+            items = self.inventory.items
             has_all_ingredients = True
-            for material_id, quantity in recipe.ingredients.items():
-                if material_id not in self.inventory.items or self.inventory.items[material_id].quantity < quantity:
+            for material_id, quantity in recipe._ingredient_items:
+                if items.get(material_id, _EMPTY_STACK).quantity < quantity:
                     has_all_ingredients = False
                     break
             if has_all_ingredients:
                 # Remove ingredients from inventory
-                for material_id, quantity in recipe.ingredients.items():
+                for material_id, quantity in recipe._ingredient_items:
                     self.inventory.remove_item(material_id, quantity)
                 # Add the crafted item to inventory
                 self.inventory.add_item(recipe.output, recipe.output_quantity)
-                log_event(f"Crafted {recipe.output_quantity} x {recipe.output.name}", 'INFO')
+                log_event("Crafted %s x %s", recipe.output_quantity, recipe.output.name, level='INFO')
                 return True
             else:
-                log_event(f"Not enough materials to craft {recipe.output.name}", 'WARNING')
+                log_event("Not enough materials to craft %s", recipe.output.name, level='WARNING')
                 return False
         else:
-            log_event(f"Recipe {recipe_id} not found", 'ERROR')
+            log_event("Recipe %s not found", recipe_id, level='ERROR')
             return False
 
 # -----------------------------
@@ -445,6 +1075,48 @@ ScreenManager:
     MachinesScreen
     CraftingScreen:
 
+# Row view classes for the RecycleViews below: one small pool of these is
+# recycled while scrolling instead of constructing a Button per entry.
+<MachineRow@Button>:
+    machine_id: ''
+    size_hint_y: None
+    height: '40dp'
+    on_press: app.show_machine_details_by_id(self.machine_id)
+
+<RecipeRow@Button>:
+    recipe_id: ''
+    size_hint_y: None
+    height: '40dp'
+    on_press: app.show_recipe_details_by_id(self.recipe_id)
+
+<MachineDetailsPopup>:
+    title: 'Machine Details'
+    size_hint: 0.6, 0.8
+    BoxLayout:
+        orientation: 'vertical'
+        padding: 10
+        spacing: 10
+        Label:
+            text: root.name_text
+        Label:
+            text: root.desc_text
+        Label:
+            text: root.power_text
+        Label:
+            text: root.cooldown_text
+        Label:
+            text: root.properties_text
+        Button:
+            text: root.toggle_text
+            size_hint_y: None
+            height: '40dp'
+            on_press: app.toggle_machine_by_id(root.machine_id)
+        Button:
+            text: 'Close'
+            size_hint_y: None
+            height: '40dp'
+            on_press: root.dismiss()
+
 <MenuScreen>:
     name: 'menu'
     BoxLayout:
@@ -578,15 +1250,19 @@ ScreenManager:
         padding: 10
         spacing: 10
         Label:
-            text: 'Power Level: ' + app.get_power_level()
+            id: power_label
+            text: app.power_level_text
             size_hint_y: None
             height: '40dp'
-        ScrollView:
+        RecycleView:
+            id: machines_grid
+            viewclass: 'MachineRow'
             do_scroll_x: False
             do_scroll_y: True
-            GridLayout:
-                id: machines_grid
-                cols: 1
+            RecycleBoxLayout:
+                orientation: 'vertical'
+                default_size: None, dp(40)
+                default_size_hint: 1, None
                 size_hint_y: None
                 height: self.minimum_height
         BoxLayout:
@@ -608,12 +1284,15 @@ ScreenManager:
         orientation: 'vertical'
         padding: 10
         spacing: 10
-        ScrollView:
+        RecycleView:
+            id: recipes_grid
+            viewclass: 'RecipeRow'
             do_scroll_x: False
             do_scroll_y: True
-            GridLayout:
-                id: recipes_grid
-                cols: 1
+            RecycleBoxLayout:
+                orientation: 'vertical'
+                default_size: None, dp(40)
+                default_size_hint: 1, None
                 size_hint_y: None
                 height: self.minimum_height
         Button:
@@ -624,6 +1303,22 @@ ScreenManager:
                 app.go_back_to_game()
 '''
 
+# Help text frozen at module scope so repeated help invocations reuse one
+# string object instead of rebuilding it per call.
+_HELP_TEXT = """Available Commands:
+  mine [N]            Mine materials; with N, batch-mine N swings at once.
+  inv                 List the contents of your inventory.
+  craft <recipe>      Craft a recipe by name.
+  recipes             List known crafting recipes.
+  machines            List your machines and their status.
+  addmachine <json>   Create a machine from a JSON spec.
+  script create <name> <code>   Store an automation script.
+  script run <name>   Run a stored script.
+  script runcmds <name>         Run a stored script's lines as game commands.
+  script delete <name>          Delete a stored script.
+  script list         List stored scripts.
+  help                Show this message."""
+
 class MenuScreen(Screen):
     pass
 
@@ -643,13 +1338,133 @@ class MachinesScreen(Screen):
 class CraftingScreen(Screen):
     recipes_grid = ObjectProperty(None)
 
+class MachineDetailsPopup(Popup):
+    # Static widget tree defined once in kv; opening the popup only assigns
+    # these properties instead of constructing Labels/Buttons per open.
+    machine_id = StringProperty('')
+    name_text = StringProperty('')
+    desc_text = StringProperty('')
+    power_text = StringProperty('')
+    cooldown_text = StringProperty('')
+    properties_text = StringProperty('')
+    toggle_text = StringProperty('')
+
 class CradiumApp(App):
+    # Observed by the machines-screen label through its kv binding; the
+    # label updates only when this actually changes, with no polling scan.
+    power_level_text = StringProperty('Power Level: 0.0')
+
     def build(self):
         self.player = None
         self.screen_manager = Builder.load_string(KV)
         load_sample_recipes()
+        # Mineable templates cached as a tuple once; mine/mine_batch no
+        # longer allocate a list of lookups per swing.
+        self._mineables = (MATERIALS_LOOKUP['iron'], MATERIALS_LOOKUP['wood'])
+        # Command dispatch table: handlers take the argument list. Built once
+        # so parsing is a dict hit, not an if/elif chain per input line.
+        self.commands: Dict[str, Callable] = {
+            'mine': self.handle_mine_command,
+            'script': self.handle_script_command,
+            'inv': lambda args: self.list_inventory_text(),
+            'craft': self.handle_craft_command,
+            'recipes': lambda args: self.list_recipes_text(),
+            'machines': lambda args: self.list_machines_text(),
+            'addmachine': self.handle_addmachine_command,
+            'help': lambda args: self.show_help(),
+        }
+        # Subcommand dispatch for 'script', same table pattern as commands:
+        # constant-time regardless of how many actions are added.
+        self._script_handlers: Dict[str, Callable] = {
+            'create': self._script_create,
+            'run': self._script_run,
+            'delete': self._script_delete,
+            'list': self._script_list,
+            'runcmds': self._script_runcmds,
+        }
+        # When set, update_output appends here instead of touching the
+        # console widget; batch runs render everything in one final write.
+        self._capture_buffer: Optional[List[str]] = None
+        # Persistent widget pools for the inventory and grid screens;
+        # show_inventory/show_grid diff against these instead of tearing
+        # every Button down and rebuilding it per screen transition.
+        self._inv_buttons: Dict[str, Button] = {}
+        self._grid_buttons: Dict[tuple, Button] = {}
+        self._grid_pool_shape: Optional[tuple] = None
+        # Console transcript history, bounded so long sessions cannot grow
+        # the TextInput buffer without limit.
+        self._console_lines: deque = deque(maxlen=500)
+        self._console_line_count = 0
+        # Single-worker executor for save/load disk I/O; one worker keeps
+        # operations ordered, and results are posted back via Clock.
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cradium-io')
+        # Last-rendered machines snapshot; show_machines skips the data
+        # rebuild when nothing changed.
+        self._machines_cache_key: Optional[tuple] = None
+        # id -> Machine index kept in step with the player's machine list;
+        # RecycleView row presses dispatch through it with one dict hit.
+        self._machines_by_id: Dict[str, Machine] = {}
+        # Reusable popups, built lazily on first open.
+        self._machine_details_popup: Optional[MachineDetailsPopup] = None
+        self._add_machine_popup: Optional[Popup] = None
+        self._add_machine_inputs: Dict[str, TextInput] = {}
         return self.screen_manager
 
+    @staticmethod
+    def _name_of_args(args) -> str:
+        # Single-token names (the common case) skip the ' '.join allocation.
+        return args[0].strip() if len(args) == 1 else ' '.join(args).strip()
+
+    def show_help(self):
+        self.update_output(_HELP_TEXT)
+
+    def list_inventory_text(self):
+        # Build the whole listing in one pass and emit it as a single
+        # console write rather than one output call per item.
+        items = self.player.inventory.items.values()
+        if not items:
+            self.update_output("Inventory is empty.")
+            return
+        lines = [f"  {item.material.name} x{item.quantity}" for item in items]
+        self.update_output("Inventory:\n" + '\n'.join(lines))
+
+    def handle_craft_command(self, args):
+        if not args:
+            self.update_output("Usage: craft <recipe name>")
+            return
+        name = self._name_of_args(args)
+        recipe = find_recipe_by_name(name)
+        if recipe is None:
+            self.update_output(f"Recipe '{name}' not found.")
+            return
+        if self.player.craft_item(recipe.id):
+            self.update_output(f"Crafted {recipe.output_quantity} x {recipe.output.name}")
+        else:
+            self.update_output(f"Failed to craft {recipe.output.name}. Not enough materials.")
+
+    def list_recipes_text(self):
+        if not RECIPES:
+            self.update_output("No recipes known.")
+            return
+        lines = [
+            f"  {r.name}: " + ', '.join(
+                f"{get_material_name(mid)} x{qty}" for mid, qty in r.ingredients.items()
+            )
+            for r in RECIPES.values()
+        ]
+        self.update_output("Available Crafting Recipes:\n" + '\n'.join(lines))
+
+    def list_machines_text(self):
+        machines = self.player.machines
+        if not machines:
+            self.update_output("No machines built.")
+            return
+        lines = [
+            f"  {m.name} ({'Active' if m.active else 'Inactive'}, power {m.power})"
+            for m in machines
+        ]
+        self.update_output("Machines:\n" + '\n'.join(lines))
+
     def get_power_level(self):
         if self.player:
             return str(round(self.player.power, 2))
@@ -660,58 +1475,190 @@ class CradiumApp(App):
         if not player_name:
             player_name = "Player1"
         self.player = Player(name=player_name)
+        self._machines_by_id = {}
+        set_log_player(player_name)
         self.player.initialize_base()
         self.screen_manager.current = 'game'
         self.update_output("Game started. Type 'mine' to gather materials.")
         Clock.schedule_interval(self.update_game_state, 1)
 
     def process_input(self, input_text):
-        tokens = shlex.split(input_text)
+        # shlex builds a full POSIX lexer state machine per call; commands are
+        # whitespace-separated except for quoted names, so only fall back to
+        # it when a quote is actually present.
+        if '"' not in input_text and "'" not in input_text:
+            tokens = input_text.split()
+        else:
+            tokens = shlex.split(input_text)
         if not tokens:
             return
-        command = tokens[0].lower()
-        args = tokens[1:]
-        if command == 'mine':
-            self.mine()
-        elif command == 'help':
-            self.update_output("Available commands: mine, help")
+        # Fast path: skip the .lower() allocation when the token is already a
+        # known command (users overwhelmingly type lowercase).
+        raw = tokens[0]
+        command = raw if raw in self.commands else raw.lower()
+        handler = self.commands.get(command)
+        if handler is not None:
+            handler(tokens[1:])
         else:
             self.update_output(f"Unknown command: '{command}'. Type 'help' for a list of commands.")
 
     def update_output(self, message):
+        if self._capture_buffer is not None:
+            self._capture_buffer.append(message)
+            return
+        # Bounded transcript: messages live in a deque and the widget text is
+        # rebuilt with one join, with a running line count for the cursor
+        # instead of re-splitting the whole buffer on every append.
+        lines = self._console_lines
+        if len(lines) == lines.maxlen:
+            self._console_line_count -= lines[0].count('\n') + 1
+        lines.append(message)
+        self._console_line_count += message.count('\n') + 1
         game_screen = self.screen_manager.get_screen('game')
         console = game_screen.ids.output_console
-        console.text += message + '\n'
+        console.text = '\n'.join(lines)
         # Auto-scroll to the bottom
-        console.cursor = (0, len(console.text.split('\n')))
+        console.cursor = (0, self._console_line_count)
+
+    def handle_script_command(self, args):
+        if not args:
+            self.update_output("Usage: script <create|run|delete|list> [name] [code]")
+            return
+        handler = self._script_handlers.get(args[0].lower())
+        if handler is not None:
+            handler(args[1:])
+        else:
+            self.update_output(f"Unknown script action: '{args[0]}'.")
+
+    def _script_create(self, args):
+        if len(args) < 2:
+            self.update_output("Usage: script create <name> <code>")
+            return
+        name = args[0]
+        content = self._name_of_args(args[1:])
+        new_script = Script(id=generate_uuid(), name=name, content=content)
+        if self.player.add_script(new_script):
+            self.update_output(f"Script '{name}' created.")
+        else:
+            self.update_output(f"A script named '{name}' already exists.")
+
+    def _script_run(self, args):
+        if not args:
+            self.update_output("Usage: script run <name>")
+            return
+        script = self.player.get_script(args[0])
+        if script is None:
+            self.update_output(f"Script '{args[0]}' not found.")
+            return
+        result = execute_script(script.content)
+        if result['stdout']:
+            self.update_output(result['stdout'].rstrip('\n'))
+        if result['stderr']:
+            self.update_output(f"Script error: {result['stderr'].rstrip(chr(10))}")
+
+    def _script_runcmds(self, args):
+        # Run a stored script's lines as game commands with console output
+        # captured: the per-command widget updates nobody would see mid-run
+        # are skipped, and the collected transcript lands in one write.
+        if not args:
+            self.update_output("Usage: script runcmds <name>")
+            return
+        script = self.player.get_script(args[0])
+        if script is None:
+            self.update_output(f"Script '{args[0]}' not found.")
+            return
+        commands = [c.strip() for chunk in script.content.split(';')
+                    for c in chunk.splitlines() if c.strip()]
+        self._capture_buffer = captured = []
+        try:
+            with quiet_logging():
+                for command_line in commands:
+                    self.process_input(command_line)
+        finally:
+            self._capture_buffer = None
+        self.update_output('\n'.join(captured) if captured else "Script produced no output.")
+
+    def _script_delete(self, args):
+        if not args:
+            self.update_output("Usage: script delete <name>")
+            return
+        if self.player.remove_script(args[0]):
+            self.update_output(f"Script '{args[0]}' deleted.")
+        else:
+            self.update_output(f"Script '{args[0]}' not found.")
+
+    def _script_list(self, args):
+        if self.player.scripts:
+            self.update_output('Scripts: ' + ', '.join(s.name for s in self.player.scripts))
+        else:
+            self.update_output("No scripts defined.")
+
+    def handle_mine_command(self, args):
+        if args and args[0].isdigit():
+            self.mine_batch(int(args[0]))
+        else:
+            self.mine()
 
     def mine(self):
         # Randomly choose between iron and wood
-        materials = [MATERIALS_LOOKUP['iron'], MATERIALS_LOOKUP['wood']]
-        material = random.choice(materials)
+        material = random.choice(self._mineables)
         self.player.inventory.add_item(material)
         self.update_output(f"Mined {material.name} (Rarity: {material.rarity}, Quality: {material.quality:.2f})")
 
+    def mine_batch(self, n: int):
+        # Scripted auto-mining path: draw all n samples in one C-level
+        # random.choices call, aggregate to per-material counts, and insert
+        # with one bulk add — no per-swing RNG, logging, or console output.
+        n = min(n, 10000)
+        counts = Counter(random.choices(self._mineables, k=n))
+        with quiet_logging():
+            self.player.inventory.add_items(counts.items())
+        summary = ', '.join(f"{mat.name} x{qty}" for mat, qty in counts.items())
+        self.update_output(f"Mined {n} materials: {summary}")
+
     def show_inventory(self):
         inventory_screen = self.screen_manager.get_screen('inventory')
         inventory_grid = inventory_screen.ids.inventory_grid
-        inventory_grid.clear_widgets()
+        # Diff against the widget pool: retitle buttons in place, create
+        # only for new materials, drop only the stacks that disappeared.
+        buttons = self._inv_buttons
+        seen = set()
         for item in self.player.inventory.list_inventory():
-            item_button = Button(
-                text=f"{item.material.name} x{item.quantity}",
-                size_hint_y=None,
-                height='40dp',
-                on_press=functools.partial(self.show_material_details, item.material)
-            )
-            inventory_grid.add_widget(item_button)
+            material = item.material
+            seen.add(material.id)
+            text = f"{material.name} x{item.quantity}"
+            item_button = buttons.get(material.id)
+            if item_button is None:
+                # One shared handler reads the material off the button, so no
+                # per-button partial object is allocated.
+                item_button = Button(
+                    text=text,
+                    size_hint_y=None,
+                    height='40dp',
+                    on_press=self._on_inventory_button
+                )
+                item_button.material = material
+                buttons[material.id] = item_button
+                inventory_grid.add_widget(item_button)
+            elif item_button.text != text:
+                item_button.text = text
+        for material_id in [mid for mid in buttons if mid not in seen]:
+            inventory_grid.remove_widget(buttons.pop(material_id))
         self.screen_manager.current = 'inventory'
 
+    def _on_inventory_button(self, btn):
+        self.show_material_details(btn.material)
+
+    def _on_cell_press(self, btn):
+        self.edit_grid_cell(*btn.cell_xy)
+
     def show_material_details(self, material, *args):
         content = BoxLayout(orientation='vertical', padding=10, spacing=10)
         content.add_widget(Label(text=f"Name: {material.name}"))
         content.add_widget(Label(text=f"Rarity: {material.rarity}"))
         content.add_widget(Label(text=f"Quality: {material.quality:.2f}"))
         content.add_widget(Label(text=f"Type: {material.material_type}"))
+        content.add_widget(Label(text=get_material_type_description(material.material_type)))
         content.add_widget(Label(text=f"Base Stone: {material.base_stone_type}"))
         close_button = Button(text='Close', size_hint_y=None, height='40dp')
         content.add_widget(close_button)
@@ -725,21 +1672,37 @@ class CradiumApp(App):
     def show_grid(self):
         grid_screen = self.screen_manager.get_screen('grid')
         grid_layout = grid_screen.ids.grid_layout
-        grid_layout.clear_widgets()
-        grid = self.player.crafting_grid.grid[0]
-        for y in range(self.player.crafting_grid.height):
-            for x in range(self.player.crafting_grid.width):
-                material = grid[y][x]
+        grid = self.player.crafting_grid
+        shape = (grid.width, grid.height)
+        if self._grid_pool_shape != shape:
+            # Dimensions changed (fresh game or a loaded save); the pooled
+            # buttons no longer map onto the cells, so rebuild once.
+            grid_layout.clear_widgets()
+            self._grid_buttons.clear()
+            self._grid_pool_shape = shape
+        buttons = self._grid_buttons
+        for y in range(grid.height):
+            for x in range(grid.width):
+                material = grid.get_item(x, y, 0)
                 btn_text = material.name if material else 'Empty'
                 btn_color = (0.6, 0.6, 0.6, 1) if material else (0.8, 0.8, 0.8, 1)
-                btn = Button(
-                    text=btn_text,
-                    background_color=btn_color,
-                    size_hint_y=None,
-                    height='60dp',
-                    on_press=functools.partial(self.edit_grid_cell, x, y)
-                )
-                grid_layout.add_widget(btn)
+                btn = buttons.get((x, y))
+                if btn is None:
+                    btn = Button(
+                        text=btn_text,
+                        background_color=btn_color,
+                        size_hint_y=None,
+                        height='60dp',
+                        on_press=self._on_cell_press
+                    )
+                    btn.cell_xy = (x, y)
+                    buttons[(x, y)] = btn
+                    grid_layout.add_widget(btn)
+                else:
+                    if btn.text != btn_text:
+                        btn.text = btn_text
+                    if tuple(btn.background_color) != btn_color:
+                        btn.background_color = btn_color
         self.screen_manager.current = 'grid'
 
     def edit_grid_cell(self, x, y, *args):
@@ -749,7 +1712,7 @@ class CradiumApp(App):
         if material_items:
             for item in material_items:
                 btn = Button(text=item.material.name, size_hint_y=None, height='40dp')
-                btn.bind(on_press=functools.partial(self.place_material_in_grid, x, y, item.material))
+                btn.bind(on_press=functools.partial(self.place_material_in_grid, x, y, item.material.id))
                 content.add_widget(btn)
         else:
             content.add_widget(Label(text='No materials in inventory.'))
@@ -763,19 +1726,25 @@ class CradiumApp(App):
         self.current_popup = popup
         popup.open()
 
-    def place_material_in_grid(self, x, y, material, *args):
-        material_item = self.player.inventory.get_item_by_name(material.name)
+    def _dismiss_then(self, refresh):
+        # Defer popup teardown and the follow-up screen rebuild to the next
+        # frame so the pressed button's own frame returns immediately.
+        popup = self.current_popup
+        Clock.schedule_once(lambda dt: (popup.dismiss(), refresh()), 0)
+
+    def place_material_in_grid(self, x, y, material_id, *args):
+        # Identity travels as the id string; names stay display-only.
+        material_item = self.player.inventory.get_item_by_id(material_id)
         if material_item:
             success = self.player.crafting_grid.place_item(x, y, 0, material_item.material)
             if success:
-                self.player.inventory.remove_item(material_item.material.id)
+                self.player.inventory.remove_item(material_id)
                 self.update_output(f"Placed {material_item.material.name} at ({x}, {y}) on grid.")
             else:
                 self.update_output(f"Failed to place {material_item.material.name} at ({x}, {y}).")
-            self.current_popup.dismiss()
-            self.show_grid()
+            self._dismiss_then(self.show_grid)
         else:
-            self.update_output(f"Material '{material.name}' not found in inventory.")
+            self.update_output(f"Material '{get_material_name(material_id)}' not found in inventory.")
 
     def remove_material_from_grid(self, x, y, *args):
         success, material = self.player.crafting_grid.remove_item(x, y, 0)
@@ -784,112 +1753,214 @@ class CradiumApp(App):
             self.update_output(f"Removed {material.name} from ({x}, {y}) back to inventory.")
         else:
             self.update_output(f"No material to remove at ({x}, {y}).")
-        self.current_popup.dismiss()
-        self.show_grid()
+        self._dismiss_then(self.show_grid)
 
     def clear_grid(self):
-        for y in range(self.player.crafting_grid.height):
-            for x in range(self.player.crafting_grid.width):
-                success, material = self.player.crafting_grid.remove_item(x, y, 0)
-                if success and material:
-                    self.player.inventory.add_item(material)
+        drained = self.player.crafting_grid.drain_all()
+        if drained:
+            self.player.inventory.add_items(drained.items())
         self.update_output("Cleared the crafting grid.")
         self.show_grid()
 
     def craft_from_grid(self):
-        # Placeholder for crafting from grid
-        self.update_output("Crafting from grid is not yet implemented.")
+        grid = self.player.crafting_grid
+        recipe = find_recipe_for_grid(grid)
+        if recipe is None:
+            self.update_output("No recipe matches the current grid layout.")
+            return
+        grid.clear()
+        self.player.inventory.add_item(recipe.output, recipe.output_quantity)
+        self.update_output(f"Crafted {recipe.output_quantity} x {recipe.output.name} from the grid.")
+        self.show_grid()
 
     def show_machines(self):
-        machines_screen = self.screen_manager.get_screen('machines')
-        machines_grid = machines_screen.ids.machines_grid
-        machines_grid.clear_widgets()
-        for machine in self.player.machines:
-            machine_button = Button(
-                text=f"{machine.name} ({'Active' if machine.active else 'Inactive'})",
-                size_hint_y=None,
-                height='40dp',
-                on_press=functools.partial(self.show_machine_details, machine)
-            )
-            machines_grid.add_widget(machine_button)
+        machines = self.player.machines
+        # Rebuild the row data only when the machine list or an active flag
+        # actually changed; re-entering the screen is otherwise free.
+        cache_key = tuple((id(machine), machine.active) for machine in machines)
+        old_key = self._machines_cache_key
+        if cache_key != old_key:
+            machines_screen = self.screen_manager.get_screen('machines')
+            machines_grid = machines_screen.ids.machines_grid
+            if (old_key is not None and len(old_key) == len(cache_key)
+                    and all(old[0] == new[0] for old, new in zip(old_key, cache_key))):
+                # Same machines, only active flags flipped: patch exactly the
+                # changed rows in place instead of reallocating the data list.
+                data = machines_grid.data
+                for i, (old, new) in enumerate(zip(old_key, cache_key)):
+                    if old[1] != new[1]:
+                        machine = machines[i]
+                        data[i]['text'] = f"{machine.name} ({'Active' if machine.active else 'Inactive'})"
+                machines_grid.refresh_from_data()
+            else:
+                # RecycleView: assigning data recycles a small pool of
+                # MachineRow views instead of rebuilding one Button per machine.
+                machines_grid.data = [
+                    {'text': f"{machine.name} ({'Active' if machine.active else 'Inactive'})",
+                     'machine_id': machine.id}
+                    for machine in machines
+                ]
+            self._machines_cache_key = cache_key
         self.screen_manager.current = 'machines'
 
+    def show_machine_details_by_id(self, machine_id):
+        machine = self._machines_by_id.get(machine_id)
+        if machine is not None:
+            self.show_machine_details(machine)
+
     def show_machine_details(self, machine, *args):
-        content = BoxLayout(orientation='vertical', padding=10, spacing=10)
-        content.add_widget(Label(text=f"Name: {machine.name}"))
-        content.add_widget(Label(text=f"Description: {machine.description}"))
-        content.add_widget(Label(text=f"Power: {machine.power}"))
-        content.add_widget(Label(text=f"Cooldown Time: {machine.cooldown_time}s"))
-        properties_text = "\n".join([f"{k}: {v}" for k, v in machine.properties.items()])
-        content.add_widget(Label(text=f"Properties:\n{properties_text}"))
-        toggle_button = Button(text='Activate' if not machine.active else 'Deactivate', size_hint_y=None, height='40dp')
-        toggle_button.bind(on_press=functools.partial(self.toggle_machine, machine))
-        content.add_widget(toggle_button)
-        close_button = Button(text='Close', size_hint_y=None, height='40dp')
-        content.add_widget(close_button)
-        popup = Popup(title='Machine Details', content=content, size_hint=(0.6, 0.8))
-        close_button.bind(on_press=popup.dismiss)
+        # One popup instance for the app lifetime; the kv rule holds the
+        # widget tree and each open is just property assignments.
+        popup = self._machine_details_popup
+        if popup is None:
+            popup = self._machine_details_popup = MachineDetailsPopup()
+        popup.machine_id = machine.id
+        popup.name_text = f"Name: {machine.name}"
+        popup.desc_text = f"Description: {machine.description}"
+        popup.power_text = f"Power: {machine.power}"
+        popup.cooldown_text = f"Cooldown Time: {machine._cooldown_str}"
+        popup.properties_text = "Properties:\n" + "\n".join(
+            f"{k}: {v}" for k, v in machine.properties.items())
+        popup.toggle_text = 'Deactivate' if machine.active else 'Activate'
         self.current_popup = popup
         popup.open()
 
+    def toggle_machine_by_id(self, machine_id):
+        machine = self._machines_by_id.get(machine_id)
+        if machine is not None:
+            self.toggle_machine(machine)
+
     def toggle_machine(self, machine, *args):
         machine.active = not machine.active
         status = 'activated' if machine.active else 'deactivated'
         self.update_output(f"Machine '{machine.name}' has been {status}.")
-        self.current_popup.dismiss()
-        self.show_machines()
+        self._dismiss_then(self.show_machines)
+
+    def _build_machine(self, name: str, description: str = '', resource_output: str = '',
+                       cooldown: float = 0.0, power: float = 0.0,
+                       grid_width: int = 5, grid_height: int = 5) -> Optional[Machine]:
+        # Pure, non-interactive builder shared by the popup and the console
+        # command, so scripts can create machines without any input() round-trip.
+        if not name:
+            return None
+        properties = {'resource_output': resource_output} if resource_output else {}
+        new_machine = Machine(
+            id=generate_uuid(),
+            name=name,
+            description=description,
+            properties=properties,
+            crafting_grid=CraftingGrid(width=grid_width, height=grid_height),
+            cooldown_time=cooldown,
+            power=power,
+            active=False
+        )
+        self.player.machines.append(new_machine)
+        self._machines_by_id[new_machine.id] = new_machine
+        return new_machine
 
-    def add_machine(self):
-        def create_machine(instance):
-            name = name_input.text.strip()
-            description = desc_input.text.strip()
-            resource_output = resource_input.text.strip()
-            cooldown = float(cooldown_input.text.strip()) if cooldown_input.text.strip() else 0.0
-            power = float(power_input.text.strip()) if power_input.text.strip() else 0.0
-            grid_width = int(grid_width_input.text.strip()) if grid_width_input.text.strip() else 5
-            grid_height = int(grid_height_input.text.strip()) if grid_height_input.text.strip() else 5
-            if not name:
-                self.update_output("Machine name cannot be empty.")
-                return
-            properties = {'resource_output': resource_output} if resource_output else {}
-            crafting_grid = CraftingGrid(width=grid_width, height=grid_height)
-            new_machine = Machine(
-                id=generate_uuid(),
-                name=name,
-                description=description,
-                properties=properties,
-                crafting_grid=crafting_grid,
-                cooldown_time=cooldown,
-                power=power,
-                active=False
-            )
-            self.player.machines.append(new_machine)
-            self.update_output(f"Machine '{name}' added.")
-            self.current_popup.dismiss()
-            self.show_machines()
+    def handle_addmachine_command(self, args):
+        if not args:
+            self.update_output('Usage: addmachine {"name": ..., "resource_output": ..., ...}')
+            return
+        try:
+            spec = json.loads(' '.join(args))
+        except ValueError as e:
+            self.update_output(f"Invalid machine spec: {e}")
+            return
+        if not isinstance(spec, dict):
+            self.update_output("Invalid machine spec: expected a JSON object.")
+            return
+        # The numeric coercions get the same treatment as the JSON parse:
+        # a spec like {"cooldown": "fast"} reports instead of raising out
+        # of the console handler.
+        try:
+            cooldown = float(spec.get('cooldown', 0.0))
+            power = float(spec.get('power', 0.0))
+            grid_width = int(spec.get('grid_width', 5))
+            grid_height = int(spec.get('grid_height', 5))
+        except (TypeError, ValueError) as e:
+            self.update_output(f"Invalid machine spec: {e}")
+            return
+        machine = self._build_machine(
+            name=str(spec.get('name', '')).strip(),
+            description=str(spec.get('description', '')),
+            resource_output=str(spec.get('resource_output', '')),
+            cooldown=cooldown,
+            power=power,
+            grid_width=grid_width,
+            grid_height=grid_height,
+        )
+        if machine is None:
+            self.update_output("Machine name cannot be empty.")
+        else:
+            self.update_output(f"Machine '{machine.name}' added.")
 
-        content = BoxLayout(orientation='vertical', padding=10, spacing=10)
-        name_input = TextInput(hint_text='Machine Name', multiline=False, size_hint_y=None, height='40dp')
-        desc_input = TextInput(hint_text='Description', multiline=False, size_hint_y=None, height='40dp')
-        resource_input = TextInput(hint_text='Resource Output', multiline=False, size_hint_y=None, height='40dp')
-        cooldown_input = TextInput(hint_text='Cooldown Time (s)', multiline=False, size_hint_y=None, height='40dp')
-        power_input = TextInput(hint_text='Power (positive for generation, negative for consumption)', multiline=False, size_hint_y=None, height='40dp')
-        grid_width_input = TextInput(hint_text='Grid Width', multiline=False, size_hint_y=None, height='40dp')
-        grid_height_input = TextInput(hint_text='Grid Height', multiline=False, size_hint_y=None, height='40dp')
-        content.add_widget(name_input)
-        content.add_widget(desc_input)
-        content.add_widget(resource_input)
-        content.add_widget(cooldown_input)
-        content.add_widget(power_input)
-        content.add_widget(grid_width_input)
-        content.add_widget(grid_height_input)
-        add_button = Button(text='Create Machine', size_hint_y=None, height='40dp')
-        add_button.bind(on_press=create_machine)
-        content.add_widget(add_button)
-        close_button = Button(text='Cancel', size_hint_y=None, height='40dp')
-        content.add_widget(close_button)
-        popup = Popup(title='Add New Machine', content=content, size_hint=(0.8, 0.9))
-        close_button.bind(on_press=popup.dismiss)
+    @staticmethod
+    def _signed_float_filter(substring, from_undo):
+        # Kivy's built-in 'float' filter rejects '-', but power may be
+        # negative (consumption), so this keeps digits, '.' and the sign.
+        # The filter is position-blind, so misplaced signs can still slip
+        # through; the create handler validates the final text.
+        return ''.join(ch for ch in substring if ch.isdigit() or ch in '.-')
+
+    def _create_machine_from_popup(self, *args):
+        inputs = self._add_machine_inputs
+        name = inputs['name'].text.strip()
+        # The input_filters keep the fields numeric-ish, but degenerate
+        # fragments like '-', '--' or a lone '.' still pass them, so the
+        # conversions stay guarded rather than crashing the press handler.
+        try:
+            cooldown = float(inputs['cooldown'].text.strip() or 0.0)
+            power = float(inputs['power'].text.strip() or 0.0)
+            grid_width = int(inputs['grid_width'].text.strip() or 5)
+            grid_height = int(inputs['grid_height'].text.strip() or 5)
+        except ValueError:
+            self.update_output("Invalid numeric value in machine fields.")
+            return
+        machine = self._build_machine(
+            name=name,
+            description=inputs['description'].text.strip(),
+            resource_output=inputs['resource'].text.strip(),
+            cooldown=cooldown,
+            power=power,
+            grid_width=grid_width,
+            grid_height=grid_height,
+        )
+        if machine is None:
+            self.update_output("Machine name cannot be empty.")
+            return
+        self.update_output(f"Machine '{name}' added.")
+        self._dismiss_then(self.show_machines)
+
+    def add_machine(self):
+        # The popup widget tree is built once and reused; subsequent opens
+        # just blank the inputs.
+        popup = self._add_machine_popup
+        if popup is None:
+            content = BoxLayout(orientation='vertical', padding=10, spacing=10)
+            inputs = {
+                'name': TextInput(hint_text='Machine Name', multiline=False, size_hint_y=None, height='40dp'),
+                'description': TextInput(hint_text='Description', multiline=False, size_hint_y=None, height='40dp'),
+                'resource': TextInput(hint_text='Resource Output', multiline=False, size_hint_y=None, height='40dp'),
+                'cooldown': TextInput(hint_text='Cooldown Time (s)', input_filter='float', multiline=False, size_hint_y=None, height='40dp'),
+                'power': TextInput(hint_text='Power (positive for generation, negative for consumption)', input_filter=self._signed_float_filter, multiline=False, size_hint_y=None, height='40dp'),
+                'grid_width': TextInput(hint_text='Grid Width', input_filter='int', multiline=False, size_hint_y=None, height='40dp'),
+                'grid_height': TextInput(hint_text='Grid Height', input_filter='int', multiline=False, size_hint_y=None, height='40dp'),
+            }
+            for text_input in inputs.values():
+                content.add_widget(text_input)
+            add_button = Button(text='Create Machine', size_hint_y=None, height='40dp',
+                                on_press=self._create_machine_from_popup)
+            content.add_widget(add_button)
+            close_button = Button(text='Cancel', size_hint_y=None, height='40dp')
+            content.add_widget(close_button)
+            popup = Popup(title='Add New Machine', content=content, size_hint=(0.8, 0.9))
+            close_button.bind(on_press=popup.dismiss)
+            self._add_machine_popup = popup
+            self._add_machine_inputs = inputs
+        else:
+            for text_input in self._add_machine_inputs.values():
+                text_input.text = ''
         self.current_popup = popup
         popup.open()
 
@@ -901,20 +1972,11 @@ class CradiumApp(App):
             self.current_popup.dismiss()
 
         def save_game(instance):
-            success = save_game_state(self.player)
-            if success:
-                self.update_output("Game saved successfully.")
-            else:
-                self.update_output("Failed to save game.")
+            self.save_game()
             self.current_popup.dismiss()
 
         def load_game(instance):
-            player = load_game_state()
-            if player:
-                self.player = player
-                self.update_output("Game loaded successfully.")
-            else:
-                self.update_output("Failed to load game.")
+            self.load_game()
             self.current_popup.dismiss()
 
         content = BoxLayout(orientation='vertical', padding=10, spacing=10)
@@ -938,23 +2000,21 @@ class CradiumApp(App):
 
     def show_crafting(self):
         crafting_screen = self.screen_manager.get_screen('crafting')
-        recipes_grid = crafting_screen.ids.recipes_grid
-        recipes_grid.clear_widgets()
-        for recipe in RECIPES.values():
-            recipe_button = Button(
-                text=recipe.name,
-                size_hint_y=None,
-                height='40dp',
-                on_press=functools.partial(self.show_recipe_details, recipe)
-            )
-            recipes_grid.add_widget(recipe_button)
+        crafting_screen.ids.recipes_grid.data = [
+            {'text': recipe.name, 'recipe_id': recipe.id}
+            for recipe in RECIPES.values()
+        ]
         self.screen_manager.current = 'crafting'
 
+    def show_recipe_details_by_id(self, recipe_id):
+        recipe = RECIPES.get(recipe_id)
+        if recipe is not None:
+            self.show_recipe_details(recipe)
+
     def show_recipe_details(self, recipe, *args):
         content = BoxLayout(orientation='vertical', padding=10, spacing=10)
         content.add_widget(Label(text=f"Recipe: {recipe.name}"))
-        ingredients_text = "\n".join([f"{MATERIALS_LOOKUP[material_id].name} x{quantity}" for material_id, quantity in recipe.ingredients.items()])
-        content.add_widget(Label(text=f"Ingredients:\n{ingredients_text}"))
+        content.add_widget(Label(text=f"Ingredients:\n{recipe.ingredients_text()}"))
         content.add_widget(Label(text=f"Produces: {recipe.output.name} x{recipe.output_quantity}"))
         craft_button = Button(text='Craft', size_hint_y=None, height='40dp')
         craft_button.bind(on_press=functools.partial(self.craft_recipe, recipe))
@@ -976,30 +2036,46 @@ class CradiumApp(App):
 
     def update_game_state(self, dt):
         self.player.update_machines()
-        # Update the power level display
-        if self.screen_manager.current == 'machines':
-            machines_screen = self.screen_manager.get_screen('machines')
-            # Update the power level label
-            for child in machines_screen.children[0].children:
-                if isinstance(child, Label):
-                    child.text = 'Power Level: ' + self.get_power_level()
-                    break
+        # Kivy properties skip dispatch when the value is unchanged, so the
+        # label only re-renders on a real power change — no screen check,
+        # no widget lookup.
+        self.power_level_text = 'Power Level: ' + self.get_power_level()
 
     def save_game(self):
-        success = save_game_state(self.player)
-        if success:
+        # Snapshot on the UI thread so the worker never reads live game
+        # state; only serialization and the disk write leave the main
+        # thread. Results are posted back via Clock so widgets are only
+        # ever touched from the Kivy thread.
+        data = self.player.to_dict()
+        future = self._io_executor.submit(save_game_data, data)
+        future.add_done_callback(
+            lambda fut: Clock.schedule_once(lambda dt: self._on_save_done(fut), 0))
+
+    def _on_save_done(self, future):
+        if future.result():
             self.update_output("Game saved successfully.")
         else:
             self.update_output("Failed to save game.")
 
     def load_game(self):
-        player = load_game_state()
+        future = self._io_executor.submit(load_game_state)
+        future.add_done_callback(
+            lambda fut: Clock.schedule_once(lambda dt: self._on_load_done(fut), 0))
+
+    def _on_load_done(self, future):
+        player = future.result()
         if player:
             self.player = player
+            self._machines_by_id = {m.id: m for m in player.machines}
+            set_log_player(player.name)
             self.update_output("Game loaded successfully.")
         else:
             self.update_output("Failed to load game.")
 
+    def on_stop(self):
+        # Let a pending save finish before the process exits.
+        self._io_executor.shutdown(wait=True)
+
     def exit_game(self):
         self.stop()
 